@@ -14,6 +14,7 @@ Search returns any TV show whose title contains the query string
 """
 
 import logging
+from collections.abc import Sequence
 
 from ucapi import (
     BrowseMediaItem,
@@ -65,8 +66,8 @@ def _make_item(
 
 
 def _paginate(
-    items: list, options: BrowseOptions | SearchOptions
-) -> tuple[list, Pagination]:
+    items: Sequence, options: BrowseOptions | SearchOptions
+) -> tuple[Sequence, Pagination]:
     """Slice *items* according to the paging options and return the slice + metadata."""
     paging = options.paging
     page = (paging.page or 1) if paging else 1
@@ -92,7 +93,7 @@ def _show_item(title: str) -> BrowseMediaItem:
     )
 
 
-def _tv_shows_directory(shows: list[str]) -> BrowseMediaItem:
+def _tv_shows_directory(shows: Sequence[str]) -> BrowseMediaItem:
     """Return the *TV Shows* directory item with embedded children."""
     return _make_item(
         media_id=_TV_SHOWS_ID,
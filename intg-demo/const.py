@@ -7,35 +7,43 @@ the ucapi-framework.
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+import sys
 from dataclasses import dataclass
 
 
-# List of great TV shows to randomly cycle through as media titles
-TV_SHOWS = [
-    "Breaking Bad",
-    "The Wire",
-    "Game of Thrones",
-    "The Sopranos",
-    "Mad Men",
-    "The Office",
-    "Friends",
-    "Seinfeld",
-    "Stranger Things",
-    "The Mandalorian",
-    "Ted Lasso",
-    "Succession",
-    "Better Call Saul",
-    "The Crown",
-    "Chernobyl",
-    "Fleabag",
-    "Black Mirror",
-    "Fargo",
-    "True Detective",
-    "Westworld",
-]
-
-
-@dataclass
+# Great TV shows to randomly cycle through as media titles.
+# A tuple so the hot selection path in device.py can index it without
+# rebuilding or copying the collection. The titles are interned so the
+# title comparisons on the update path hit CPython's pointer-equality
+# fast path instead of comparing character by character.
+TV_SHOWS = tuple(
+    sys.intern(show)
+    for show in (
+        "Breaking Bad",
+        "The Wire",
+        "Game of Thrones",
+        "The Sopranos",
+        "Mad Men",
+        "The Office",
+        "Friends",
+        "Seinfeld",
+        "Stranger Things",
+        "The Mandalorian",
+        "Ted Lasso",
+        "Succession",
+        "Better Call Saul",
+        "The Crown",
+        "Chernobyl",
+        "Fleabag",
+        "Black Mirror",
+        "Fargo",
+        "True Detective",
+        "Westworld",
+    )
+)
+
+
+@dataclass(slots=True)
 class DemoConfig:
     """
     Demo device configuration dataclass.
@@ -28,6 +28,20 @@ _LOG = logging.getLogger(__name__)
 # Polling interval in seconds - the demo device polls every 30 seconds
 POLL_INTERVAL = 30
 
+# Relaxed polling interval used while the device is OFF - a poll in that
+# state does no work, so there is no point waking up every 30 seconds
+POLL_INTERVAL_OFF = 300
+
+# Cached length of the show list - avoids a len() call on every selection
+_N_SHOWS = len(TV_SHOWS)
+
+# States referenced on the poll and command paths, hoisted to module scope
+# so each use is a single global load instead of two attribute lookups
+_ON = media_player.States.ON
+_OFF = media_player.States.OFF
+_PLAYING = media_player.States.PLAYING
+_PAUSED = media_player.States.PAUSED
+
 
 class DemoDevice(PollingDevice):
     """
@@ -44,6 +58,17 @@ class DemoDevice(PollingDevice):
     - Validating framework changes
     """
 
+    # Play/pause state transitions: current state -> (next state, pick a new show).
+    # Unlisted states (e.g. UNKNOWN) leave the device unchanged.
+    _PLAY_PAUSE_TRANSITIONS: dict[
+        media_player.States, tuple[media_player.States, bool]
+    ] = {
+        _OFF: (_PLAYING, True),
+        _ON: (_PLAYING, True),
+        _PAUSED: (_PLAYING, True),
+        _PLAYING: (_PAUSED, False),
+    }
+
     def __init__(
         self,
         device_config: DemoConfig,
@@ -66,12 +91,29 @@ class DemoDevice(PollingDevice):
             driver=driver,
         )
 
+        # The identifier is immutable for the device's lifetime, so cache it
+        # once instead of walking the config dataclass on every update push
+        self._identifier: str = device_config.identifier
+        # Log identifier is equally immutable - computed once so log calls
+        # on the poll/command paths don't chain through two properties
+        self._log_id: str = device_config.name or device_config.identifier
+        # Address is fixed at setup time - cached for the same reason
+        self._address: str | None = device_config.address
+
         # Initialize device state tracking
-        self._power_state: media_player.States = media_player.States.OFF
+        self._power_state: media_player.States = _OFF
         self._media_title: str = ""
+        # Index of the last randomly selected show, -1 before the first pick
+        self._last_idx: int = -1
+        # Per-device RNG - skips the module-level indirection of the global
+        # random functions and keeps devices independent of each other
+        self._rng = random.Random()
 
         # Attribute dict keyed by device_id (str) — supplemental media player fields
         self._media_player_attributes: dict[str, MediaPlayerAttributes] = {}
+        # Direct reference to this device's own attribute container so the
+        # update path hands it out without a dict lookup per refresh
+        self._own_attributes: MediaPlayerAttributes | None = None
 
     # =========================================================================
     # Properties
@@ -80,7 +122,7 @@ class DemoDevice(PollingDevice):
     @property
     def identifier(self) -> str:
         """Return the device identifier."""
-        return self._device_config.identifier
+        return self._identifier
 
     @property
     def name(self) -> str:
@@ -90,7 +132,7 @@ class DemoDevice(PollingDevice):
     @property
     def address(self) -> str | None:
         """Return the device address."""
-        return self._device_config.address
+        return self._address
 
     @property
     def state(self) -> media_player.States:
@@ -105,7 +147,7 @@ class DemoDevice(PollingDevice):
     @property
     def log_id(self) -> str:
         """Return a log identifier for debugging."""
-        return self.name if self.name else self.identifier
+        return self._log_id
 
     # =========================================================================
     # Typed attribute accessors (keyed by device_id)
@@ -115,6 +157,8 @@ class DemoDevice(PollingDevice):
         self, device_id: str
     ) -> MediaPlayerAttributes | None:
         """Return current MediaPlayer attributes for the given device_id."""
+        if device_id == self._identifier:
+            return self._own_attributes
         return self._media_player_attributes.get(device_id)
 
     # =========================================================================
@@ -136,18 +180,21 @@ class DemoDevice(PollingDevice):
         # self._device_id = response.get("serial_number")
         # self._model = response.get("model")
         """
+        # Cached values passed as lazy %s args, so the logging module only
+        # formats them when INFO is actually enabled
         _LOG.info(
             "[%s] Demo device connection established (simulated) at %s",
-            self.log_id,
-            self.address,
+            self._log_id,
+            self._address,
         )
         # Set initial state to ON when connecting
-        self._power_state = media_player.States.ON
+        self._power_state = _ON
         self._select_random_show()
-        self._media_player_attributes[self.identifier] = MediaPlayerAttributes(
+        self._own_attributes = MediaPlayerAttributes(
             MEDIA_TITLE=self._media_title,
             MEDIA_IMAGE_URL="https://avatars.githubusercontent.com/u/102359576?s=200&v=4",
         )
+        self._media_player_attributes[self._identifier] = self._own_attributes
         self.push_update()
 
     async def poll_device(self) -> None:
@@ -162,18 +209,21 @@ class DemoDevice(PollingDevice):
         # self._power_state = PowerState(response.get("power"))
         # self._media_title = response.get("now_playing", {}).get("title", "")
         """
-        _LOG.debug("[%s] Polling demo device...", self.log_id)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("[%s] Polling demo device...", self._log_id)
 
         # Only update media title if device is ON or PLAYING
-        if self._power_state in (media_player.States.ON, media_player.States.PLAYING):
+        if self._power_state in (_ON, _PLAYING):
+            prev_title = self._media_title
             self._select_random_show()
+            # Interned titles make this a pointer comparison; skip the push
+            # when the poll produced no visible change
+            if self._media_title == prev_title:
+                return
             _LOG.info(
                 "[%s] Poll update - Now showing: %s", self.log_id, self._media_title
             )
-            attrs = self._media_player_attributes.get(self.identifier)
-            if attrs:
-                attrs.MEDIA_TITLE = self._media_title
-            self.push_update()
+            self._push_media_update()
 
     # =========================================================================
     # Power Control
@@ -181,32 +231,28 @@ class DemoDevice(PollingDevice):
 
     async def power_on(self) -> None:
         """Turn on the demo device."""
+        if self._power_state == _ON:
+            # Already in the requested state - don't push a duplicate update
+            return
         _LOG.debug("[%s] Powering on", self.log_id)
-        self._power_state = media_player.States.ON
+        self._power_state = _ON
         self._select_random_show()
-        attrs = self._media_player_attributes.get(self.identifier)
-        if attrs:
-            attrs.MEDIA_TITLE = self._media_title
-        self.push_update()
+        self._push_media_update()
 
     async def power_off(self) -> None:
         """Turn off the demo device."""
+        if self._power_state == _OFF:
+            # Already off - don't push a duplicate update
+            return
         _LOG.debug("[%s] Powering off", self.log_id)
-        self._power_state = media_player.States.OFF
+        self._power_state = _OFF
         self._media_title = ""
-        attrs = self._media_player_attributes.get(self.identifier)
-        if attrs:
-            attrs.MEDIA_TITLE = self._media_title
-        self.push_update()
+        self._push_media_update()
 
     async def power_toggle(self) -> None:
         """Toggle the demo device power state."""
         _LOG.debug("[%s] Toggling power", self.log_id)
-        if self._power_state in (
-            media_player.States.ON,
-            media_player.States.PLAYING,
-            media_player.States.PAUSED,
-        ):
+        if self._power_state in (_ON, _PLAYING, _PAUSED):
             await self.power_off()
         else:
             await self.power_on()
@@ -222,26 +268,14 @@ class DemoDevice(PollingDevice):
         When pressed, this cycles to a random TV show and updates the media title.
         This demonstrates the framework's ability to handle commands and emit updates.
         """
-        _LOG.debug("[%s] Play/Pause pressed", self.log_id)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("[%s] Play/Pause pressed", self._log_id)
 
-        if self._power_state == media_player.States.OFF:
-            # Turn on if off
-            await self.power_on()
-            self._power_state = media_player.States.PLAYING
-        elif self._power_state == media_player.States.PAUSED:
-            # Resume playing and pick a new show
-            self._power_state = media_player.States.PLAYING
-            self._select_random_show()
-        elif self._power_state in (
-            media_player.States.ON,
-            media_player.States.PLAYING,
-            media_player.States.PAUSED,
-        ):
-            # Toggle between playing and paused, pick new show when resuming
-            if self._power_state == media_player.States.PLAYING:
-                self._power_state = media_player.States.PAUSED
-            else:
-                self._power_state = media_player.States.PLAYING
+        next_state, pick_show = self._PLAY_PAUSE_TRANSITIONS.get(
+            self._power_state, (self._power_state, False)
+        )
+        self._power_state = next_state
+        if pick_show:
             self._select_random_show()
 
         _LOG.info(
@@ -250,29 +284,52 @@ class DemoDevice(PollingDevice):
             self._media_title,
             self._power_state,
         )
-        attrs = self._media_player_attributes.get(self.identifier)
-        if attrs:
-            attrs.MEDIA_TITLE = self._media_title
-        self.push_update()
+        self._push_media_update()
 
     # =========================================================================
     # Helper Methods
     # =========================================================================
 
+    def _push_media_update(self) -> None:
+        """
+        Sync the current media title into the attribute store and push one update.
+
+        All command and poll paths funnel through this helper so each state
+        change results in a single attribute write and a single update event.
+        The poll cadence is adapted to the new state at the same time.
+        """
+        attrs = self._own_attributes
+        if attrs:
+            attrs.MEDIA_TITLE = self._media_title
+        self._set_poll_interval(
+            POLL_INTERVAL_OFF if self._power_state == _OFF else POLL_INTERVAL
+        )
+        self.push_update()
+
+    def _set_poll_interval(self, interval: int) -> None:
+        """
+        Adjust the polling cadence of the PollingDevice base class.
+
+        The poll loop reads the interval before every sleep, so a new value
+        takes effect on the next cycle without restarting the loop.
+        """
+        if self._poll_interval != interval:
+            _LOG.debug("[%s] Poll interval set to %s s", self.log_id, interval)
+            self._poll_interval = interval
+
     async def select_show(self, title: str) -> None:
         """Directly set the current media title to the given TV show."""
         _LOG.debug("[%s] Show selected: %s", self.log_id, title)
         self._media_title = title
+        # Keep the random sampler from repeating a directly selected show
+        try:
+            self._last_idx = TV_SHOWS.index(title)
+        except ValueError:
+            self._last_idx = -1
         # Ensure the device is playing when a show is picked
-        if self._power_state not in (
-            media_player.States.ON,
-            media_player.States.PLAYING,
-        ):
-            self._power_state = media_player.States.ON
-        attrs = self._media_player_attributes.get(self.identifier)
-        if attrs:
-            attrs.MEDIA_TITLE = self._media_title
-        self.push_update()
+        if self._power_state not in (_ON, _PLAYING):
+            self._power_state = _ON
+        self._push_media_update()
 
     async def select_first_show(self) -> None:
         """Select the first show in the TV_SHOWS list."""
@@ -300,6 +357,12 @@ class DemoDevice(PollingDevice):
 
     def _select_random_show(self) -> None:
         """Select a random TV show from the list."""
-        # Avoid selecting the same show twice in a row
-        available_shows = [show for show in TV_SHOWS if show != self._media_title]
-        self._media_title = random.choice(available_shows)
+        # Avoid selecting the same show twice in a row: draw a non-zero
+        # offset from the previous index and wrap around, which covers every
+        # show except the previous one without building an intermediate list.
+        if self._last_idx < 0:
+            idx = self._rng.randrange(_N_SHOWS)
+        else:
+            idx = (self._last_idx + 1 + self._rng.randrange(_N_SHOWS - 1)) % _N_SHOWS
+        self._last_idx = idx
+        self._media_title = TV_SHOWS[idx]
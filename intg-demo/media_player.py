@@ -10,6 +10,7 @@ the ucapi-framework after changes.
 """
 
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import browser as demo_browser
@@ -31,8 +32,9 @@ from ucapi_framework import MediaPlayerAttributes, MediaPlayerEntity, create_ent
 _LOG = logging.getLogger(__name__)
 
 # Features supported by the demo media player
-# The demo device supports basic playback controls and media title display
-FEATURES = [
+# The demo device supports basic playback controls and media title display.
+# An immutable tuple, so every entity instance shares the one collection.
+FEATURES: tuple[media_player.Features, ...] = (
     media_player.Features.ON_OFF,
     media_player.Features.TOGGLE,
     media_player.Features.PLAY_PAUSE,
@@ -40,7 +42,23 @@ FEATURES = [
     media_player.Features.BROWSE_MEDIA,
     media_player.Features.SEARCH_MEDIA,
     media_player.Features.PLAY_MEDIA,
-]
+)
+
+
+def _cmd(cmd_id: str) -> Callable:
+    """
+    Tag an async method as the handler for the given media player command.
+
+    Tagged methods are collected into the class-level dispatch table, so
+    subclasses can add or override commands simply by defining a tagged
+    method - no match statement or table to edit.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func._cmd_id = cmd_id  # pylint: disable=protected-access
+        return func
+
+    return decorator
 
 
 class DemoMediaPlayer(MediaPlayerEntity):
@@ -56,6 +74,26 @@ class DemoMediaPlayer(MediaPlayerEntity):
     TV show and displaying it as the media title.
     """
 
+    # Command id -> handler method, populated from @_cmd tags at class
+    # creation - one dict lookup per command instead of a branch cascade
+    _DISPATCH: dict[str, Callable[..., Awaitable[ucapi.StatusCodes]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Rebuild the dispatch table for subclasses that add commands."""
+        super().__init_subclass__(**kwargs)
+        cls._collect_command_handlers()
+
+    @classmethod
+    def _collect_command_handlers(cls) -> None:
+        """Collect @_cmd tagged methods from the MRO into the dispatch table."""
+        dispatch: dict[str, Callable[..., Awaitable[ucapi.StatusCodes]]] = {}
+        for base in reversed(cls.__mro__):
+            for attr in vars(base).values():
+                cmd_id = getattr(attr, "_cmd_id", None)
+                if cmd_id is not None:
+                    dispatch[cmd_id] = attr
+        cls._DISPATCH = dispatch
+
     def __init__(self, config_device: DemoConfig, device_instance: device.DemoDevice):
         """
         Initialize the demo media player entity.
@@ -83,16 +121,19 @@ class DemoMediaPlayer(MediaPlayerEntity):
         if device_instance is not None:
             self.subscribe_to_device(device_instance)
 
+        # Reusable attribute buffer for sync_state - update() reads the
+        # fields into a dict synchronously, so the same instance can be
+        # refilled on every sync instead of allocating a new dataclass
+        self._sync_buffer = MediaPlayerAttributes()
+
     async def sync_state(self) -> None:
         """Sync entity state from device."""
         attrs = self._device.get_media_player_attributes(self._device.identifier)
-        self.update(
-            MediaPlayerAttributes(
-                STATE=self._device.state,
-                MEDIA_TITLE=attrs.MEDIA_TITLE if attrs else None,
-                MEDIA_IMAGE_URL=attrs.MEDIA_IMAGE_URL if attrs else None,
-            )
-        )
+        buffer = self._sync_buffer
+        buffer.STATE = self._device.state
+        buffer.MEDIA_TITLE = attrs.MEDIA_TITLE if attrs else None
+        buffer.MEDIA_IMAGE_URL = attrs.MEDIA_IMAGE_URL if attrs else None
+        self.update(buffer)
 
     async def handle_command(
         self,
@@ -125,39 +166,58 @@ class DemoMediaPlayer(MediaPlayerEntity):
             _LOG.warning("No device instance for entity: %s", self.id)
             return ucapi.StatusCodes.SERVICE_UNAVAILABLE
 
-        try:
-            match cmd_id:
-                case media_player.Commands.ON:
-                    await self._device.power_on()
+        handler = self._DISPATCH.get(cmd_id)
+        if handler is None:
+            _LOG.warning("Unhandled command: %s", cmd_id)
+            return ucapi.StatusCodes.NOT_IMPLEMENTED
 
-                case media_player.Commands.OFF:
-                    await self._device.power_off()
-
-                case media_player.Commands.TOGGLE:
-                    await self._device.power_toggle()
-
-                case media_player.Commands.PLAY_PAUSE:
-                    # This is the main demo feature - cycles through random TV shows
-                    await self._device.play_pause()
-
-                case media_player.Commands.PLAY_MEDIA:
-                    media_id = (params or {}).get("media_id", "")
-                    if media_id:
-                        await self._device.select_show(media_id)
-                    else:
-                        _LOG.warning("PLAY_MEDIA missing media_id parameter")
-                        return ucapi.StatusCodes.BAD_REQUEST
-
-                case _:
-                    _LOG.warning("Unhandled command: %s", cmd_id)
-                    return ucapi.StatusCodes.NOT_IMPLEMENTED
-
-            return ucapi.StatusCodes.OK
+        try:
+            return await handler(self, params)
 
         except Exception as ex:  # pylint: disable=broad-exception-caught
             _LOG.error("Error executing command %s: %s", cmd_id, ex)
             return ucapi.StatusCodes.BAD_REQUEST
 
+    # =========================================================================
+    # Command Handlers
+    # =========================================================================
+
+    @_cmd(media_player.Commands.ON)
+    async def _cmd_on(self, _params: dict[str, Any] | None) -> ucapi.StatusCodes:
+        """Turn on the demo device."""
+        await self._device.power_on()
+        return ucapi.StatusCodes.OK
+
+    @_cmd(media_player.Commands.OFF)
+    async def _cmd_off(self, _params: dict[str, Any] | None) -> ucapi.StatusCodes:
+        """Turn off the demo device."""
+        await self._device.power_off()
+        return ucapi.StatusCodes.OK
+
+    @_cmd(media_player.Commands.TOGGLE)
+    async def _cmd_toggle(self, _params: dict[str, Any] | None) -> ucapi.StatusCodes:
+        """Toggle the demo device power state."""
+        await self._device.power_toggle()
+        return ucapi.StatusCodes.OK
+
+    @_cmd(media_player.Commands.PLAY_PAUSE)
+    async def _cmd_play_pause(
+        self, _params: dict[str, Any] | None
+    ) -> ucapi.StatusCodes:
+        """Cycle to a random TV show - the main demo feature."""
+        await self._device.play_pause()
+        return ucapi.StatusCodes.OK
+
+    @_cmd(media_player.Commands.PLAY_MEDIA)
+    async def _cmd_play_media(self, params: dict[str, Any] | None) -> ucapi.StatusCodes:
+        """Play the show identified by params["media_id"]."""
+        media_id = (params or {}).get("media_id", "")
+        if not media_id:
+            _LOG.warning("PLAY_MEDIA missing media_id parameter")
+            return ucapi.StatusCodes.BAD_REQUEST
+        await self._device.select_show(media_id)
+        return ucapi.StatusCodes.OK
+
     async def browse(self, options: BrowseOptions) -> BrowseResults | ucapi.StatusCodes:
         """
         Handle a browse-media request from the remote.
@@ -189,3 +249,7 @@ class DemoMediaPlayer(MediaPlayerEntity):
         except Exception as ex:  # pylint: disable=broad-exception-caught
             _LOG.error("Error searching media: %s", ex)
             return ucapi.StatusCodes.SERVER_ERROR
+
+
+# __init_subclass__ only fires for subclasses - seed the base table here
+DemoMediaPlayer._collect_command_handlers()  # pylint: disable=protected-access
@@ -9,8 +9,9 @@ The device ID and name are auto-generated.
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+import functools
 import logging
-import uuid
+import secrets
 from typing import Any
 
 from const import DemoConfig
@@ -19,6 +20,51 @@ from ucapi_framework import BaseSetupFlow
 
 _LOG = logging.getLogger(__name__)
 
+# Maps address separators (IPv4 dots, IPv6 colons) to underscores so the
+# address can be embedded in a device identifier in a single pass
+_ADDR_TRANS = str.maketrans(".:", "__")
+
+
+@functools.cache
+def _manual_entry_form() -> RequestUserInput:
+    """
+    Build the manual entry form for demo device setup.
+
+    Constructed lazily on first use and cached, so the nested schema dicts
+    are only allocated when setup actually runs - and only once, even if the
+    form is re-displayed after validation errors.
+    """
+    return RequestUserInput(
+        {"en": "Demo Device Setup"},
+        [
+            {
+                "id": "info",
+                "label": {
+                    "en": "Setup Demo Device",
+                },
+                "field": {
+                    "label": {
+                        "value": {
+                            "en": (
+                                "Enter an IP address to set up the demo device. "
+                                "This is a simulated device for testing the ucapi-framework. "
+                                "The IP address doesn't need to be reachable - it's just used "
+                                "as a placeholder identifier."
+                            ),
+                        }
+                    }
+                },
+            },
+            {
+                "field": {"text": {"value": "192.168.1.100"}},
+                "id": "address",
+                "label": {
+                    "en": "IP Address",
+                },
+            },
+        ],
+    )
+
 
 class DemoSetupFlow(BaseSetupFlow[DemoConfig]):
     """
@@ -35,36 +81,7 @@ class DemoSetupFlow(BaseSetupFlow[DemoConfig]):
 
         :return: RequestUserInput with a simple IP address field
         """
-        return RequestUserInput(
-            {"en": "Demo Device Setup"},
-            [
-                {
-                    "id": "info",
-                    "label": {
-                        "en": "Setup Demo Device",
-                    },
-                    "field": {
-                        "label": {
-                            "value": {
-                                "en": (
-                                    "Enter an IP address to set up the demo device. "
-                                    "This is a simulated device for testing the ucapi-framework. "
-                                    "The IP address doesn't need to be reachable - it's just used "
-                                    "as a placeholder identifier."
-                                ),
-                            }
-                        }
-                    },
-                },
-                {
-                    "field": {"text": {"value": "192.168.1.100"}},
-                    "id": "address",
-                    "label": {
-                        "en": "IP Address",
-                    },
-                },
-            ],
-        )
+        return _manual_entry_form()
 
     async def query_device(
         self, input_values: dict[str, Any]
@@ -111,9 +128,9 @@ class DemoSetupFlow(BaseSetupFlow[DemoConfig]):
             # ================================================================
 
             # For the demo, auto-generate the identifier and name
-            # Using a short UUID suffix to make it unique but readable
-            short_id = str(uuid.uuid4())[:8]
-            identifier = f"demo_{address.replace('.', '_')}_{short_id}"
+            # Using a short random hex suffix to make it unique but readable
+            short_id = secrets.token_hex(4)
+            identifier = f"demo_{address.translate(_ADDR_TRANS)}_{short_id}"
 
             # Auto-generate a friendly name
             name = f"Demo ({address})"